@@ -1,8 +1,6 @@
 """Python Revenue Assurance Process Optimizer."""
 
-from .main.scheduler import Scheduler
-from .main.control import Control
-from .web import WEBAPI
+import importlib
 
 
 __author__ = 'Timur Faradzhov'
@@ -15,4 +13,19 @@ __maintainer__ = 'Timur Faradzhov'
 __email__ = 'timurfaradzhov@gmail.com'
 __status__ = 'Development'
 
-__all__ = [Scheduler, Control, WEBAPI]
+__all__ = ['Scheduler', 'Control', 'WEBAPI']
+
+_modules = {'Scheduler': '.main.scheduler',
+            'Control': '.main.control',
+            'WEBAPI': '.web'}
+
+
+def __getattr__(name):
+    """Import public interfaces on first access."""
+    if name in _modules:
+        module = importlib.import_module(_modules[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    message = f'module {__name__!r} has no attribute {name!r}'
+    raise AttributeError(message)
@@ -4,20 +4,24 @@ Used to transfer parameters from user to application.
 """
 
 import os
-import re
+import warnings
 import configparser
 
 
 path = os.path.abspath(os.path.expanduser('~/.rapo/rapo.ini'))
 encoding = 'utf-8'
+sentinels = {'NONE': None, 'TRUE': True, 'FALSE': False}
 
 
 class Configurator(dict):
     """Represents main configurator."""
 
+    _cache = {}
+
     def __init__(self):
         super().__init__()
-        if self.found:
+        self._found = os.path.exists(path)
+        if self._found:
             names = ['SCHEDULER', 'DATABASE', 'LOGGING', 'API']
             for name in names:
                 self[name] = Configuration(name)
@@ -25,26 +29,38 @@ class Configurator(dict):
 
     def load(self):
         """Load configuration from file into memory."""
+        stat = os.stat(path)
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        values = self._cache.get(key)
+        if values is None:
+            values = self._parse()
+            self._cache.clear()
+            self._cache[key] = values
+        for section, options in values.items():
+            dict.update(self[section], options)
+        return self
+
+    def _parse(self):
         parser = configparser.ConfigParser(allow_no_value=True)
         parser.read(path, encoding=encoding)
+        values = {}
         for section in parser.sections():
-            for option in parser.options(section):
-                initial_value = parser[section][option]
-                final_value = self.normalize(initial_value)
-                self[section][option] = final_value
-        return self
+            options = parser.items(section)
+            values[section] = {option.lower(): self.normalize(value)
+                               for option, value in options}
+        return values
 
     def normalize(self, value):
         """Normalize given parameter value."""
-        if value is None or value.upper() == 'NONE' or value.isspace():
+        if value is None or value.isspace():
             return None
-        elif value.upper() == 'TRUE':
-            return True
-        elif value.upper() == 'FALSE':
-            return False
-        elif re.match(r'^[+-]?\d+$', value):
+        upper_value = value.upper()
+        if upper_value in sentinels:
+            return sentinels[upper_value]
+        digits = value[1:] if value[:1] in ('+', '-') else value
+        if digits.isdecimal():
             return int(value)
-        elif re.match(r'^[+-]?(\d*.\d+|\d+\.\d*)$', value):
+        elif digits.replace('.', '', 1).isdecimal():
             return float(value)
         return value
 
@@ -57,9 +73,7 @@ class Configurator(dict):
     @property
     def found(self):
         """Determine whether configuration file found or not."""
-        if os.path.exists(path):
-            return True
-        return False
+        return self._found
 
 
 class Configuration(dict):
@@ -85,12 +99,14 @@ class Configuration(dict):
         """Get the parameter, considering the depreciations."""
         parameter = self.get(required)
         if not parameter:
-            if self.get(used):
-                parameter = self.get(used)
-                print(f'Please use parameter [{required}] instead of',
-                      f'[{used}], which is deprecated and will be',
-                      f'removed soon from [{self.name}] section',
-                      f'of {path} configuration file!')
+            fallback = self.get(used)
+            if fallback:
+                parameter = fallback
+                message = (f'Please use parameter [{required}] instead of '
+                           f'[{used}], which is deprecated and will be '
+                           f'removed soon from [{self.name}] section '
+                           f'of {path} configuration file!')
+                warnings.warn(message, FutureWarning, stacklevel=2)
         return parameter
 
 
@@ -1,7 +1,11 @@
 """Contains database instance with application schema."""
 
 import os
+import re
 import sys
+import functools as ft
+import concurrent.futures as cf
+import threading as th
 
 import sqlalchemy as sa
 import cx_Oracle as oracle
@@ -17,21 +21,35 @@ class Database():
     ckwargs = {'literal_binds': True}
 
     def __init__(self):
+        self.metadata = sa.MetaData()
+        self.locks = {name: th.Lock() for name in self.Tables.names.values()}
         if self.configured:
             self.setup()
             self.load()
             self.formatter = self.Formatter(self)
 
     class Tables():
-        """Represents database tables."""
+        """Represents database tables.
+
+        Tables are loaded on first access so that only the ones really
+        used by the application are reflected from the database.
+        """
+
+        names = {'config': 'rapo_config',
+                 'config_bak': 'rapo_config_bak',
+                 'log': 'rapo_log',
+                 'scheduler': 'rapo_scheduler',
+                 'web_api': 'rapo_web_api'}
 
         def __init__(self, database):
             self.database = database
-            self.config = self.load('rapo_config')
-            self.config_bak = self.load('rapo_config_bak')
-            self.log = self.load('rapo_log')
-            self.scheduler = self.load('rapo_scheduler')
-            self.web_api = self.load('rapo_web_api')
+
+        def __getattr__(self, name):
+            if name not in self.names:
+                raise AttributeError(name)
+            table = self.load(self.names[name])
+            setattr(self, name, table)
+            return table
 
         def load(self, name):
             """Load one of database table by name.
@@ -41,14 +59,24 @@ class Database():
             table : sqlalchemy.Table
                 Database table instance.
             """
-            meta = sa.MetaData()
-            engine = self.database.engine
-            table = sa.Table(name, meta, autoload=True, autoload_with=engine)
-            return table
+            return self.database.table(name)
 
     class Formatter():
         """Represents database query formatter."""
 
+        keywords = ['all', 'and', 'as', 'asc', 'begin', 'between', 'by',
+                    'case', 'create', 'cross', 'delete', 'desc', 'distinct',
+                    'drop', 'else', 'end', 'exists', 'from', 'full', 'group',
+                    'having', 'in', 'inner', 'insert', 'into', 'is', 'join',
+                    'left', 'like', 'not', 'null', 'on', 'or', 'order',
+                    'outer', 'right', 'select', 'set', 'table', 'then',
+                    'truncate', 'union', 'update', 'values', 'when', 'where',
+                    'with']
+        pattern = re.compile(r"('(?:[^']|'')*'|\"[^\"]*\"|--[^\n]*|/\*.*?\*/)"
+                             rf"|\b({'|'.join(keywords)})\b",
+                             re.IGNORECASE | re.DOTALL)
+        delimiter = '-'*40
+
         def __init__(self, database):
             self.database = database
 
@@ -59,14 +87,18 @@ class Database():
             return result
 
         def document(self, *statements):
-            """Format given SQL statements for documents or logging."""
-            results = []
+            """Format given SQL statements for documents or logging.
+
+            Only keyword case is changed here, so statements that are just
+            logged are not run through the full sqlparse layout.
+            """
+            results = [self.delimiter]
             for statement in statements:
                 text = self._prepare(statement)
-                result = self._parse(text)
+                result = self._parse_fast(text)
                 results.append(result)
-            body = '\n'.join(results)
-            result = f'{str():->40}\n{body}\n{str():->40}'
+            results.append(self.delimiter)
+            result = '\n'.join(results)
             return result
 
         def _prepare(self, statement):
@@ -74,12 +106,22 @@ class Database():
             result = self._separate(string)
             return result
 
-        def _parse(self, statement):
+        @staticmethod
+        @ft.lru_cache(maxsize=512)
+        def _parse(statement):
             result = spa.format(statement, keyword_case='upper',
                                 identifier_case='lower',
                                 reindent_aligned=True)
             return result
 
+        def _parse_fast(self, statement):
+            result = self.pattern.sub(self._upper, statement)
+            return result
+
+        def _upper(self, match):
+            literal, keyword = match.groups()
+            return literal or keyword.upper()
+
         def _compile(self, statement):
             if isinstance(statement, str):
                 return statement
@@ -92,8 +134,9 @@ class Database():
                 return result
 
         def _separate(self, statement):
-            if statement.rstrip()[-1] != ';':
-                statement = f'{statement.rstrip()};'
+            statement = statement.rstrip()
+            if not statement.endswith(';'):
+                statement = f'{statement};'
             return statement
 
     def setup(self):
@@ -112,9 +155,13 @@ class Database():
         max_identifier_length = parameters.get('max_identifier_length', 128)
         max_overflow = parameters.get('max_overflow', 10)
         pool_pre_ping = parameters.get('pool_pre_ping', True)
-        pool_size = parameters.get('pool_size', 5)
+        parallelism = config['SCHEDULER'].get('control_parallelism') or 1
+        pool_size = parameters.get('pool_size', max(5, parallelism*3))
         pool_recycle = parameters.get('pool_recycle', -1)
         pool_timeout = parameters.get('pool_timeout', 30)
+        query_cache_size = parameters.get('query_cache_size', 1200)
+        arraysize = parameters.get('arraysize', 1000)
+        stmtcachesize = parameters.get('stmtcachesize', 50)
         if vendor_name == 'sqlite' and path:
             if sys.platform.startswith('win'):
                 url = f'{vendor_name}:///{path}'
@@ -137,8 +184,15 @@ class Database():
                             pool_pre_ping=pool_pre_ping,
                             pool_size=pool_size,
                             pool_recycle=pool_recycle,
-                            pool_timeout=pool_timeout)
+                            pool_timeout=pool_timeout,
+                            query_cache_size=query_cache_size,
+                            arraysize=arraysize)
         self.engine = sa.create_engine(url, **settings)
+        if vendor_name == 'oracle':
+            @sa.event.listens_for(self.engine, 'connect')
+            def connect(connection, record):
+                connection.stmtcachesize = stmtcachesize
+        self.workers = cf.ThreadPoolExecutor(max_workers=pool_size)
 
     def load(self):
         """Read database objects into memory."""
@@ -155,35 +209,154 @@ class Database():
         connection = self.engine.connect()
         return connection
 
-    def execute(self, statement):
+    def session(self):
+        """Get database connection with an open transaction.
+
+        Must be used as a context manager. The transaction is committed
+        when the block ends normally and rolled back on error.
+
+        Returns
+        -------
+        context : context manager
+            Context manager returning sqlalchemy.Connection instance.
+        """
+        return self.engine.begin()
+
+    def execute(self, statement, parameters=None):
         """Execute given SQL statement.
 
+        Statement is executed in its own transaction which is committed
+        on success and rolled back on error.
+
+        Parameters
+        ----------
+        statement : str or sqlalchemy statement
+            Statement that must be executed.
+        parameters : dict or list, optional
+            Values for the statement bind parameters. A list of
+            dictionaries is sent in one executemany call.
+
         Returns
         -------
         result : sqlalchemy.engine.CursorResult
             Execution result object.
         """
+        with self.engine.begin() as conn:
+            if parameters is None:
+                result = conn.execute(statement)
+            else:
+                result = conn.execute(statement, parameters)
+        return result
+
+    def parallelize(self, *targets):
+        """Execute given functions concurrently in separate threads.
+
+        Functions are run by the shared worker threads sized to the
+        connection pool. Each function is expected to work through the
+        ordinary database methods, so every thread checks out its own
+        pooled connection. The first raised exception is propagated to the
+        caller once the functions already running are finished.
+
+        Parameters
+        ----------
+        *targets : callable
+            Functions that must be executed.
+
+        Returns
+        -------
+        results : list
+            Values returned by the functions in the given order.
+        """
+        if not targets:
+            return []
+        futures = [self.submit(target) for target in targets]
+        done, pending = cf.wait(futures, return_when=cf.FIRST_EXCEPTION)
+        if pending:
+            for future in pending:
+                future.cancel()
+            cf.wait(pending)
+        for future in futures:
+            if not future.cancelled() and future.exception() is not None:
+                raise future.exception()
+        return [future.result() for future in futures]
+
+    def submit(self, target):
+        """Schedule given function on the shared worker threads.
+
+        Parameters
+        ----------
+        target : callable
+            Function that must be executed.
+
+        Returns
+        -------
+        future : concurrent.futures.Future
+            Object representing the function execution.
+        """
+        current = th.current_thread()
+        name = f'{current.name}-Worker'
+        future = self.workers.submit(self._delegate, name, target)
+        return future
+
+    def _delegate(self, name, target):
+        thread = th.current_thread()
+        default_name = thread.name
+        thread.name = name
         try:
-            conn = self.connect()
-            result = conn.execute(statement)
-        except Exception as error:
-            conn.close()
-            raise error
-        else:
-            conn.close()
-            return result
+            return target()
+        finally:
+            thread.name = default_name
 
     def table(self, name):
         """Get database table.
 
+        RAPO tables are reflected once and kept in the shared metadata.
+        Any other table is described in the database again on each request,
+        so changes made to it outside of this instance are always seen.
+        Each RAPO table has its own lock, so a table that is still being
+        reflected by one thread is never returned to another, while
+        reflection of different tables is not serialized.
+
+        Parameters
+        ----------
+        name : str
+            Name of the database table.
+
         Returns
         -------
         table : sqlalchemy.Table
             Database table instance.
         """
-        meta = sa.MetaData()
-        table = sa.Table(name, meta, autoload=True, autoload_with=self.engine)
-        return table
+        if name not in self.Tables.names.values():
+            meta = sa.MetaData()
+            table = sa.Table(name, meta, autoload=True,
+                             autoload_with=self.engine)
+            return table
+        with self.locks[name]:
+            table = self.metadata.tables.get(name)
+            if table is None:
+                meta = self.metadata
+                engine = self.engine
+                table = sa.Table(name, meta, autoload=True,
+                                 autoload_with=engine)
+            return table
+
+    def has_table(self, name):
+        """Check whether database table exists.
+
+        Parameters
+        ----------
+        name : str
+            Name of the database table.
+
+        Returns
+        -------
+        exists : bool
+            Whether the table exists in the database.
+        """
+        with self.connect() as connection:
+            inspector = sa.inspect(connection)
+            return inspector.has_table(name)
 
     def drop(self, table_name):
         """Drop database table by name.
@@ -11,3 +11,10 @@ logger.configure(format='{isodate}\t{thread}\t{rectype}\t{message}\n')
 if config.check('LOGGING'):
     parameters = config['LOGGING']
     logger.configure(**parameters)
+
+
+def debugging():
+    """Check whether debug messages are enabled in current configuration."""
+    if config.check('LOGGING'):
+        return config['LOGGING'].get('debug') is True
+    return False
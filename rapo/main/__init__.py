@@ -4,4 +4,4 @@ from .scheduler import Scheduler
 from .control import Control
 
 
-__all__ = [Scheduler, Control]
+__all__ = ['Scheduler', 'Control']
@@ -1,6 +1,7 @@
 """Contains RAPO control interface."""
 
 import sys
+import functools as ft
 import threading as th
 import multiprocessing as mp
 import traceback as tb
@@ -13,7 +14,7 @@ import datetime as dt
 import sqlalchemy as sa
 
 from ..database import db
-from ..logger import logger
+from ..logger import logger, debugging
 from ..reader import reader
 from ..utils import utils
 
@@ -34,6 +35,8 @@ class Control():
         Data source date lower bound.
     date_to : str or datetime, optional
         Data source date upper bound.
+    config : dict, optional
+        Already fetched RAPO_CONFIG record for this control.
 
     Attributes
     ----------
@@ -107,6 +110,8 @@ class Control():
         Flag to define whether run database prerun hook function or not.
     need_hook : bool or None
         Flag to define whether run database hook procedure or not.
+    hook : concurrent.futures.Future or None
+        Background execution of the database postrun hook procedure.
     source_table : sqlalchemy.Table
         Proxy object reflecting data source table.
     source_table_a : sqlalchemy.Table
@@ -161,9 +166,9 @@ class Control():
     """
 
     def __init__(self, name=None, timestamp=None, process_id=None,
-                 date=None, date_from=None, date_to=None):
+                 date=None, date_from=None, date_to=None, config=None):
         self.name = name or reader.read_control_name(process_id)
-        self.config = reader.read_control_config(self.name)
+        self.config = config or reader.read_control_config(self.name)
         self.result = reader.read_control_result(process_id)
         self.id = int(self.config['control_id'])
         self.group = self.config['control_group']
@@ -172,11 +177,14 @@ class Control():
         self.engine = self.config['control_engine']
         self.timestamp = timestamp
 
-        self.parser = Parser(self)
-        self.executor = Executor(self)
+        fields = ['source_date_field',
+                  'source_date_field_a',
+                  'source_date_field_b']
+        self._fields = {k: utils.to_lower(self.config[k]) for k in fields}
 
         self.process = None
         self.handler = None
+        self.hook = None
 
         self.process_id = process_id
         if self.result:
@@ -250,7 +258,7 @@ class Control():
 
         self._with_error = False
         self._all_errors = []
-        self._pending_error = None
+        self._pending_update = {}
 
     def __str__(self):
         """Take control information and represent it as a simple string.
@@ -260,13 +268,43 @@ class Control():
         value : str
             Control name with or withoud process id.
         """
-        if self.process_id is None:
-            return f'[{self.name}]'
-        else:
-            return f'[{self.name}:{self.process_id}]'
+        if self._string is None:
+            if self._process_id is None:
+                self._string = f'[{self._name}]'
+            else:
+                self._string = f'[{self._name}:{self._process_id}]'
+        return self._string
 
     __repr__ = __str__
 
+    @classmethod
+    def from_row(cls, row, **kwargs):
+        """Create control from already fetched RAPO_CONFIG record.
+
+        Parameters
+        ----------
+        row : sqlalchemy.Row or dict
+            RAPO_CONFIG record of the control.
+
+        Returns
+        -------
+        control : rapo.Control
+            Control instance that does not read its configuration again.
+        """
+        config = dict(row)
+        name = config['control_name']
+        return cls(name=name, config=config, **kwargs)
+
+    @ft.cached_property
+    def parser(self):
+        """Get parser instance for this control."""
+        return Parser(self)
+
+    @ft.cached_property
+    def executor(self):
+        """Get executor instance for this control."""
+        return Executor(self)
+
     @property
     def name(self):
         """Get control name."""
@@ -276,6 +314,7 @@ class Control():
     def name(self, value):
         if isinstance(value, str) or value is None:
             self._name = value
+            self._string = None
         else:
             type = value.__class__.__name__
             message = f'name must be str or None, not {type}'
@@ -296,6 +335,9 @@ class Control():
     def process_id(self, value):
         if isinstance(value, int) or value is None:
             self._process_id = value
+            self._string = None
+            for name in ('source_name', 'source_name_a', 'source_name_b'):
+                self.__dict__.pop(name, None)
         else:
             type = value.__class__.__name__
             message = f'process_id must be int or None, not {type}'
@@ -306,7 +348,7 @@ class Control():
         """Shortcut for process_id."""
         return self._process_id
 
-    @property
+    @ft.cached_property
     def source_name(self):
         """Get control data source name."""
         return self.parser.parse_source_name()
@@ -319,9 +361,9 @@ class Control():
     @property
     def source_date_field(self):
         """Get control data source date field."""
-        return utils.to_lower(self.config['source_date_field'])
+        return self._fields['source_date_field']
 
-    @property
+    @ft.cached_property
     def source_name_a(self):
         """Get control data source A name."""
         return self.parser.parse_source_name_a()
@@ -334,9 +376,9 @@ class Control():
     @property
     def source_date_field_a(self):
         """Get control data source A date field."""
-        return utils.to_lower(self.config['source_date_field_a'])
+        return self._fields['source_date_field_a']
 
-    @property
+    @ft.cached_property
     def source_name_b(self):
         """Get control data source B name."""
         return self.parser.parse_source_name_b()
@@ -349,7 +391,7 @@ class Control():
     @property
     def source_date_field_b(self):
         """Get control data source B date field."""
-        return utils.to_lower(self.config['source_date_field_b'])
+        return self._fields['source_date_field_b']
 
     @property
     def result_columns(self):
@@ -460,7 +502,7 @@ class Control():
             return True
         return False
 
-    @property
+    @ft.cached_property
     def rule_config(self):
         """Get control match configuration."""
         if self.type == 'ANL':
@@ -480,7 +522,7 @@ class Control():
         """Get control result configuration."""
         return self.parser.parse_result_config()
 
-    @property
+    @ft.cached_property
     def error_config(self):
         """Get control error configuration."""
         if self.type == 'ANL':
@@ -496,17 +538,17 @@ class Control():
         if self.type == 'ANL':
             return self.parser.parse_analyze_error_sql()
 
-    @property
+    @ft.cached_property
     def output_columns(self):
         """Get control output column configuration."""
         return self.parser.parse_output_columns()
 
-    @property
+    @ft.cached_property
     def output_columns_a(self):
         """Get control output A column configuration."""
         return self.parser.parse_output_columns_a()
 
-    @property
+    @ft.cached_property
     def output_columns_b(self):
         """Get control output B column configuration."""
         return self.parser.parse_output_columns_b()
@@ -516,41 +558,51 @@ class Control():
         """Get control mandatory output columns configuration."""
         return self.parser.parse_mandatory_columns()
 
-    @property
+    @ft.cached_property
     def need_a(self):
         """Get parameter defining necessity of data source A saving."""
         return self.parser.parse_boolean('need_a')
 
-    @property
+    @ft.cached_property
     def need_b(self):
         """Get parameter defining necessity of data source B saving."""
         return self.parser.parse_boolean('need_b')
 
-    @property
+    @ft.cached_property
     def with_deletion(self):
         """Get parameter to clear output table before usage."""
         return self.parser.parse_boolean('with_deletion')
 
-    @property
+    @ft.cached_property
     def with_drop(self):
         """Get parameter to drop output table before usage."""
         return self.parser.parse_boolean('with_drop')
 
-    @property
+    @ft.cached_property
     def need_hook(self):
         """Get parameter defining necessity of hook execution."""
         return self.parser.parse_boolean('need_hook')
 
-    @property
+    @ft.cached_property
     def need_prerun_hook(self):
         """Get parameter defining necessity of prerun hook execution."""
         return self.parser.parse_boolean('need_prerun_hook')
 
-    @property
+    @ft.cached_property
     def need_postrun_hook(self):
         """Get parameter defining necessity of postrun hook execution."""
         return self.parser.parse_boolean('need_postrun_hook')
 
+    @ft.cached_property
+    def _log_insert(self):
+        return db.tables.log.insert()
+
+    @ft.cached_property
+    def _log_update(self):
+        log = db.tables.log
+        process_id = sa.bindparam('log_process_id')
+        return log.update().where(log.c.process_id == process_id)
+
     @property
     def text_error(self):
         """Get textual error representation of current control run."""
@@ -609,13 +661,12 @@ class Control():
         try:
             self.status = 'I'
             logger.debug(f'{self} Creating new record in {db.tables.log}')
-            insert = db.tables.log.insert()
-            insert = insert.values(control_id=self.id,
-                                   added=dt.datetime.now(),
-                                   status=self.status,
-                                   date_from=self.date_from,
-                                   date_to=self.date_to)
-            result = db.execute(insert)
+            values = dict(control_id=self.id,
+                          added=dt.datetime.now(),
+                          status=self.status,
+                          date_from=self.date_from,
+                          date_to=self.date_to)
+            result = db.execute(self._log_insert, values)
             self.process_id = int(result.inserted_primary_key[0])
         except Exception:
             logger.error()
@@ -645,7 +696,8 @@ class Control():
                 self.prerequisite_value = result
                 logger.info(f'{self} Control prerequisite statement '
                             f'returns {self.prerequisite_value}')
-                self._update(prerequisite_value=self.prerequisite_value)
+                self._update(prerequisite_value=self.prerequisite_value,
+                             flush=False)
                 if not self.prerequisite_value:
                     return False
             except Exception:
@@ -828,113 +880,71 @@ class Control():
         logger.info(f'{self} Fetching records...')
         if self.type in ('ANL', 'REP'):
             logger.info(f'{self} Fetching {self.source_name}...')
-            self.input_table = self.executor.fetch_records()
-            self.fetched = self.executor.count_fetched()
+            self.input_table, self.fetched = self.executor.fetch_records()
             logger.info(f'{self} Records fetched: {self.fetched}')
             self._update(fetched=self.fetched)
         elif self.type == 'REC':
-            threads = []
-            current = th.current_thread()
-            for attr in ('_fetch_a', '_fetch_b'):
-                name = f'{current.name}({attr[1:]})'
-                func = getattr(self, attr)
-                thread = th.Thread(target=func, name=name, daemon=True)
-                thread.start()
-                threads.append(thread)
-            for thread in threads:
-                thread.join()
-                if self._pending_error is not None:
-                    raise self._pending_error
+            db.parallelize(self._fetch_a, self._fetch_b)
             self._update(fetched_a=self.fetched_a, fetched_b=self.fetched_b)
 
     def _fetch_a(self):
-        try:
-            self.__fetch_a()
-        except Exception as error:
-            self._pending_error = error
-
-    def __fetch_a(self):
         logger.info(f'{self} Fetching {self.source_name_a}...')
-        self.input_table_a = self.executor.fetch_records_a()
-        self.fetched_a = self.executor.count_fetched_a()
+        self.input_table_a, self.fetched_a = self.executor.fetch_records_a()
         logger.info(f'{self} Records fetched A: {self.fetched_a}')
 
     def _fetch_b(self):
-        try:
-            self.__fetch_b()
-        except Exception as error:
-            self._pending_error = error
-
-    def __fetch_b(self):
         logger.info(f'{self} Fetching {self.source_name_b}...')
-        self.input_table_b = self.executor.fetch_records_b()
-        self.fetched_b = self.executor.count_fetched_b()
+        self.input_table_b, self.fetched_b = self.executor.fetch_records_b()
         logger.info(f'{self} Records fetched B: {self.fetched_b}')
 
     def _execute(self):
         logger.info(f'{self} Executing control...')
         if self.type == 'ANL':
-            if self.fetched or 0 > 0:
-                self.error_table = self.executor.analyze()
-                self.errors = self.executor.count_errors()
+            if (self.fetched or 0) > 0:
+                self.error_table, self.errors = self.executor.analyze()
                 self.success = self.fetched-self.errors
                 self.error_level = (self.errors/self.fetched)*100
-                self._update(errors=self.errors,
-                             success=self.success,
-                             error_level=self.error_level)
+            else:
+                self.errors = 0
+                self.success = 0
+                self.error_level = 0.0
+            self._update(errors=self.errors,
+                         success=self.success,
+                         error_level=self.error_level,
+                         flush=False)
         elif self.type == 'REP':
-            if self.fetched or 0 > 0:
-                self.error_table = self.executor.analyze()
+            if (self.fetched or 0) > 0:
+                self.error_table, self.errors = self.executor.analyze()
         elif self.type == 'REC' and self.subtype == 'MA':
-            threads = []
-            current = th.current_thread()
-            for action in ('match', 'mismatch'):
-                name = f'{current.name}({action})'
-                func = getattr(self, f'_{action}')
-                thread = th.Thread(target=func, name=name, daemon=True)
-                thread.start()
-                threads.append(thread)
-            for thread in threads:
-                thread.join()
-                if self._pending_error is not None:
-                    raise self._pending_error
-            self.error_level = (self.errors/(self.success+self.errors))*100
+            db.parallelize(self._match, self._mismatch)
+            total = self.success+self.errors
+            if total > 0:
+                self.error_level = (self.errors/total)*100
+            else:
+                self.error_level = 0.0
             self._update(errors=self.errors,
                          success=self.success,
-                         error_level=self.error_level)
+                         error_level=self.error_level,
+                         flush=False)
         logger.info(f'{self} Control executed')
 
     def _match(self):
-        try:
-            self.__match()
-        except Exception as error:
-            self._pending_error = error
-
-    def __match(self):
-        self.result_table = self.executor.match()
-        self.success = self.executor.count_matched()
+        self.result_table, self.success = self.executor.match()
 
     def _mismatch(self):
-        try:
-            self.__mismatch()
-        except Exception as error:
-            self._pending_error = error
-
-    def __mismatch(self):
-        self.error_table = self.executor.mismatch()
-        self.errors = self.executor.count_mismatched()
+        self.error_table, self.errors = self.executor.mismatch()
 
     def _save(self):
         logger.info(f'{self} Saving results...')
         if self.type == 'ANL':
-            if self.errors or 0 > 0:
+            if (self.errors or 0) > 0:
                 self.executor.save_errors()
         elif self.type == 'REP':
-            if self.fetched or 0 > 0:
+            if (self.errors or 0) > 0:
                 self.executor.save_errors()
         elif self.type == 'REC':
             if self.subtype == 'MA':
-                if self.errors or 0 > 0:
+                if (self.errors or 0) > 0:
                     self.executor.save_mismatches()
         logger.info(f'{self} Results saved')
 
@@ -966,27 +976,39 @@ class Control():
         else:
             outdated_results = list(self.parser.parse_outdated_results())
             if outdated_results:
-                for table, process_ids in outdated_results:
-                    for process_id in process_ids:
-                        repr = f'[{self.name}:{process_id}]'
-                        logger.info(f'{repr} Deleting results in {table}...')
-                        id = table.c.rapo_process_id
-                        query = table.delete().where(id == process_id)
-                        text = db.formatter.document(query)
-                        logger.debug(f'{self} Deleting from {table} '
-                                     f'with query:\n{text}')
-                        db.execute(query)
-                        logger.info(f'{repr} Results in {table} deleted')
+                with db.session() as connection:
+                    for table, process_ids in outdated_results:
+                        self._clean_table(connection, table, process_ids)
                 logger.info(f'{self} Control results cleaned')
             else:
                 logger.info(f'{self} No control results to clean')
 
-    def _update(self, **kwargs):
-        logger.debug(f'{self} Updating {db.tables.log} with {kwargs}')
-        update = db.tables.log.update()
-        update = update.values(**kwargs, updated=dt.datetime.now())
-        update = update.where(db.tables.log.c.process_id == self.process_id)
-        db.execute(update)
+    def _clean_table(self, connection, table, process_ids):
+        logger.info(f'{self} Deleting results of processes {process_ids} '
+                    f'in {table}...')
+        id = table.c.rapo_process_id
+        outdated = self.parser.parse_outdated_processes()
+        query = table.delete().where(id.in_(outdated))
+        if debugging():
+            text = db.formatter.document(query)
+            logger.debug(f'{self} Deleting from {table} '
+                         f'with query:\n{text}')
+        connection.execute(query)
+        logger.info(f'{self} Results in {table} deleted')
+
+    def _update(self, flush=True, **kwargs):
+        self._pending_update.update(kwargs)
+        if flush:
+            self._flush_update()
+
+    def _flush_update(self):
+        kwargs = self._pending_update
+        if debugging():
+            logger.debug(f'{self} Updating {db.tables.log} with {kwargs}')
+        values = dict(kwargs, updated=dt.datetime.now(),
+                      log_process_id=self.process_id)
+        db.execute(self._log_update, values)
+        self._pending_update = {}
         logger.debug(f'{self} {db.tables.log} updated')
 
     def _prerun_hook(self):
@@ -1001,7 +1023,13 @@ class Control():
 
     def _postrun_hook(self):
         if self.need_hook and self.need_postrun_hook:
-            self.executor.postrun_hook()
+            self.hook = db.submit(self.executor.postrun_hook)
+            self.hook.add_done_callback(self._postrun_hook_done)
+
+    def _postrun_hook_done(self, future):
+        error = future.exception()
+        if error is not None:
+            logger.error(f'{self} Error executing postrun hook: {error}')
 
 
 class Parser():
@@ -1134,7 +1162,8 @@ class Parser():
     def _parse_source_table(self, name):
         logger.debug(f'{self.c} Parsing source table {name}...')
         if isinstance(name, str) is True or name is None:
-            table = db.table(name) if isinstance(name, str) is True else None
+            is_name = isinstance(name, str) is True
+            table = db.table(name) if is_name else None
             if table is None:
                 message = f'Source table {name} is not defined'
                 raise AttributeError(message)
@@ -1258,7 +1287,7 @@ class Parser():
         """
         tables = []
         for name in self.control.output_names:
-            if db.engine.has_table(name):
+            if db.has_table(name):
                 table = db.table(name)
                 tables.append(table)
         return tables
@@ -1296,7 +1325,7 @@ class Parser():
         """
         tables = []
         for name in self.control.temp_names:
-            if db.engine.has_table(name):
+            if db.has_table(name):
                 table = db.table(name)
                 tables.append(table)
         return tables
@@ -1666,27 +1695,35 @@ class Parser():
                          process_id=control.process_id)
         return variables
 
-    def parse_outdated_results(self):
-        """Create list with tables and IDs of outdated control results."""
+    def parse_outdated_processes(self):
+        """Create query selecting IDs of outdated control processes."""
         log = db.tables.log
         control_id = self.control.id
         days_retention = self.control.config['days_retention']
         today = dt.date.today().strftime(r'%Y-%m-%d')
         current_date = sa.func.to_date(today, 'YYYY-MM-DD')
         target_date = current_date-days_retention
+        select = sa.select([log.c.process_id])
+        query = (select.where(log.c.control_id == control_id)
+                       .where(log.c.added < target_date))
+        return query
+
+    def parse_outdated_results(self):
+        """Create list with tables and IDs of outdated control results."""
+        log = db.tables.log
+        outdated = self.parse_outdated_processes()
         for table in self.parse_output_tables():
-            select = sa.select([log.c.process_id])
             subq = sa.select([table.c.rapo_process_id])
-            query = (select.where(log.c.control_id == control_id)
-                           .where(log.c.added < target_date)
-                           .where(log.c.process_id.in_(subq))
-                           .order_by(log.c.process_id))
-            text = db.formatter.document(query)
-            logger.debug(f'{self.c} Searching outdated results in {table} '
-                         f'with query:\n{text}')
+            query = (outdated.where(log.c.process_id.in_(subq))
+                             .order_by(log.c.process_id))
+            if debugging():
+                text = db.formatter.document(query)
+                logger.debug(f'{self.c} Searching outdated results '
+                             f'in {table} with query:\n{text}')
             result = db.execute(query)
             pids = [row[0] for row in result]
-            logger.debug(f'{self.c} Outdated results in {table}: {pids}')
+            if debugging():
+                logger.debug(f'{self.c} Outdated results in {table}: {pids}')
             if pids:
                 yield (table, pids)
 
@@ -1715,12 +1752,14 @@ class Executor():
         table : sqlalchemy.Table
             Object reflecting table with fetched data in case if DB is chosen
             engine.
+        fetched : int
+            Number of fetched records.
         """
         select = self.control.select
         if self.control.engine == 'DB':
             tablename = f'rapo_temp_fd_{self.control.process_id}'
-            table = self._fetch_records_to_table(select, tablename)
-            return table
+            table, fetched = self._fetch_records_to_table(select, tablename)
+            return table, fetched
 
     def fetch_records_a(self):
         """Fetch data source A.
@@ -1730,12 +1769,14 @@ class Executor():
         table : sqlalchemy.Table
             Object reflecting table with fetched data in case if DB is chosen
             engine.
+        fetched : int
+            Number of fetched records.
         """
         select = self.control.select_a
         if self.control.engine == 'DB':
             tablename = f'rapo_temp_fda_{self.control.process_id}'
-            table = self._fetch_records_to_table(select, tablename)
-            return table
+            table, fetched = self._fetch_records_to_table(select, tablename)
+            return table, fetched
 
     def fetch_records_b(self):
         """Fetch data source B.
@@ -1745,12 +1786,14 @@ class Executor():
         table : sqlalchemy.Table
             Object reflecting table with fetched data in case if DB is chosen
             engine.
+        fetched : int
+            Number of fetched records.
         """
         select = self.control.select_b
         if self.control.engine == 'DB':
             tablename = f'rapo_temp_fdb_{self.control.process_id}'
-            table = self._fetch_records_to_table(select, tablename)
-            return table
+            table, fetched = self._fetch_records_to_table(select, tablename)
+            return table, fetched
 
     def analyze(self):
         """Run data analyze used for control with ANL type.
@@ -1760,6 +1803,8 @@ class Executor():
         table : sqlalchemy.Table
             Object reflecting table with found discrepancies in case if DB is
             chosen engine.
+        errors : int
+            Number of found discrepancies.
         """
         logger.debug(f'{self.c} Analyzing...')
         input_table = self.control.input_table
@@ -1782,16 +1827,9 @@ class Executor():
         tablename = f'rapo_temp_err_{self.control.process_id}'
         clause = sa.text(self.control.error_sql)
         select = select.where(clause)
-        select = db.compile(select)
-        ctas = sa.text(f'CREATE TABLE {tablename} AS\n{select}')
-        text = db.formatter.document(ctas)
-        logger.info(f'{self.c} Creating {tablename} with query:\n{text}')
-        db.execute(ctas)
-        logger.debug(f'{self.c} {tablename} created')
-
-        table = db.table(tablename)
+        table, errors = self._create_table(select, tablename)
         logger.debug(f'{self.c} Analyzing done')
-        return table
+        return table, errors
 
     def match(self):
         """Run data matching for control with REC type and MA subtype.
@@ -1801,6 +1839,8 @@ class Executor():
         table : sqlalchemy.Table
             Object reflecting table with matched data in case if DB is chosen
             engine.
+        matched : int
+            Number of matched records.
         """
         logger.debug(f'{self.c} Defining matches...')
 
@@ -1837,7 +1877,7 @@ class Executor():
             column_a = table_a.c[rule['column_a']]
             column_b = table_b.c[rule['column_b']]
             keys.append(column_a == column_b)
-        join = table_a.join(table_b, *keys)
+        join = table_a.join(table_b, sa.and_(*keys))
         select = sa.select(columns).select_from(join)
 
         keys = []
@@ -1847,16 +1887,9 @@ class Executor():
             select = select.where(column_a == column_b)
 
         tablename = f'rapo_temp_md_{self.control.process_id}'
-        select = db.compile(select)
-        ctas = sa.text(f'CREATE TABLE {tablename} AS\n{select}')
-        text = db.formatter.document(ctas)
-        logger.info(f'{self.c} Creating {tablename} with query:\n{text}')
-        db.execute(ctas)
-        logger.debug(f'{self.c} {tablename} created')
-
-        table = db.table(tablename)
+        table, matched = self._create_table(select, tablename)
         logger.debug(f'{self.c} Matches defined')
-        return table
+        return table, matched
 
     def mismatch(self):
         """Run data mismatching for control with REC type and MA subtype.
@@ -1866,6 +1899,8 @@ class Executor():
         table : sqlalchemy.Table
             Object reflecting table with mismatched data in case if DB is
             chosen engine.
+        mismatched : int
+            Number of mismatched records.
         """
         logger.debug(f'{self.c} Defining mismatches...')
 
@@ -1914,16 +1949,9 @@ class Executor():
             select = select.where((column_a != column_b) | (column_b == None) )
 
         tablename = f'rapo_temp_nmd_{self.control.process_id}'
-        select = db.compile(select)
-        ctas = sa.text(f'CREATE TABLE {tablename} AS\n{select}')
-        text = db.formatter.document(ctas)
-        logger.info(f'{self.c} Creating {tablename} with query:\n{text}')
-        db.execute(ctas)
-        logger.debug(f'{self.c} {tablename} created')
-
-        table = db.table(tablename)
+        table, mismatched = self._create_table(select, tablename)
         logger.debug(f'{self.c} Mismatches defined')
-        return table
+        return table, mismatched
 
     def count_fetched(self):
         """Count fetched records in data source."""
@@ -2043,13 +2071,14 @@ class Executor():
             Object reflecting RAPO_RESULT.
         """
         tablename = f'rapo_rest_{self.control.name}'.lower()
-        if self.control.with_deletion or self.control.with_drop:
-            if db.engine.has_table(tablename):
-                if self.control.with_deletion:
-                    db.truncate(tablename)
-                elif self.control.with_drop:
-                    db.drop(tablename)
-        if not db.engine.has_table(tablename):
+        exists = db.has_table(tablename)
+        if exists:
+            if self.control.with_deletion:
+                db.truncate(tablename)
+            elif self.control.with_drop:
+                db.drop(tablename)
+                exists = False
+        if not exists:
             logger.debug(f'{self.c} Table {tablename} will be created')
 
             columns = []
@@ -2093,17 +2122,16 @@ class Executor():
             select = sa.select(columns)
             select = select.where(sa.literal(1) == sa.literal(0))
             select = db.compile(select)
-            ctas = f'CREATE TABLE {tablename} AS\n{select}'
+            ctas = (f'CREATE TABLE {tablename} '
+                    f'ROW STORE COMPRESS ADVANCED AS\n{select}')
             index = (f'CREATE INDEX {tablename}_rapo_process_id_ix '
                      f'ON {tablename}(rapo_process_id) COMPRESS')
-            compress = (f'ALTER TABLE {tablename} '
-                        'MOVE ROW STORE COMPRESS ADVANCED')
-            text = db.formatter.document(ctas, index, compress)
-            logger.debug(f'{self.c} Creating table {tablename} '
-                         f'with query:\n{text}')
+            if debugging():
+                text = db.formatter.document(ctas, index)
+                logger.debug(f'{self.c} Creating table {tablename} '
+                             f'with query:\n{text}')
             db.execute(ctas)
             db.execute(index)
-            db.execute(compress)
             logger.debug(f'{self.c} {tablename} created')
         table = db.table(tablename)
         return table
@@ -2111,18 +2139,28 @@ class Executor():
     def drop_temporary_tables(self):
         """Clean all temporary tables created during control execution."""
         logger.debug(f'{self.c} Dropping temporary tables...')
-        for table in self.control.temp_tables:
-            table.drop(db.engine)
+        names = self.control.temp_names
+        if names:
+            drops = [f"  BEGIN EXECUTE IMMEDIATE 'DROP TABLE {name} PURGE';\n"
+                     '  EXCEPTION WHEN OTHERS THEN\n'
+                     '    IF SQLCODE != -942 THEN RAISE; END IF;\n'
+                     '  END;' for name in names]
+            block = '\n'.join(['BEGIN', *drops, 'END;'])
+            if debugging():
+                logger.debug(f'{self.c} Dropping temporary tables '
+                             f'with block:\n{block}')
+            db.execute(sa.text(block))
         logger.debug(f'{self.c} Temporary tables dropped')
 
     def prerun_hook(self):
         """Execute database prerun hook function."""
         logger.debug(f'{self.c} Executing prerun hook function...')
         process_id = self.control.process_id
-        select = f'select rapo_prerun_control_hook({process_id}) from dual'
+        select = 'select rapo_prerun_control_hook(:process_id) from dual'
         stmt = sa.text(select)
         try:
-            result_code = db.execute(stmt).scalar()
+            parameters = {'process_id': process_id}
+            result_code = db.execute(stmt, parameters).scalar()
             if result_code is None or result_code.upper() == 'OK':
                 logger.debug(f'{self.c} Hook function evaluated OK')
                 return True, result_code
@@ -2138,21 +2176,30 @@ class Executor():
         """Execute database postrun hook procedure."""
         logger.debug(f'{self.c} Executing postrun hook procedure...')
         process_id = self.control.process_id
-        stmt = sa.text(f'begin rapo_postrun_control_hook({process_id}); end;')
-        db.execute(stmt)
+        stmt = sa.text('begin rapo_postrun_control_hook(:process_id); end;')
+        db.execute(stmt, {'process_id': process_id})
         logger.debug(f'{self.c} Hook procedure executed')
 
     def _fetch_records_to_table(self, select, tablename):
         logger.debug(f'{self.c} Start fetching...')
+        table, fetched = self._create_table(select, tablename)
+        logger.debug(f'{self.c} Fetching done')
+        return table, fetched
+
+    def _create_table(self, select, tablename):
+        empty = select.where(sa.literal(1) == sa.literal(0))
+        empty = db.compile(empty)
         select = db.compile(select)
-        ctas = sa.text(f'CREATE TABLE {tablename} AS\n{select}')
-        text = db.formatter.document(ctas)
+        ctas = sa.text(f'CREATE TABLE {tablename} NOLOGGING AS\n{empty}')
+        insert = sa.text(f'INSERT /*+ APPEND */ INTO {tablename}\n{select}')
+        text = db.formatter.document(ctas, insert)
         logger.info(f'{self.c} Creating {tablename} with query:\n{text}')
         db.execute(ctas)
-        logger.info(f'{self.c} {tablename} created')
+        result = db.execute(insert)
+        count = result.rowcount
+        logger.info(f'{self.c} {tablename} created with {count} records')
         table = db.table(tablename)
-        logger.debug(f'{self.c} Fetching done')
-        return table
+        return table, count
 
     def _count_fetched_to_table(self, table):
         logger.debug(f'{self.c} Counting fetched in {table}...')
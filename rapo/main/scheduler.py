@@ -395,5 +395,5 @@ class Scheduler():
         select = config.select().order_by(config.c.control_id)
         result = db.execute(select)
         for row in result:
-            control = Control(name=row.control_name)
+            control = Control.from_row(row)
             control.clean()
@@ -192,21 +192,23 @@ class Reader():
         """Get list of all datasources in the DB."""
 
         result = db.execute("select object_name from user_objects where object_type in ('VIEW', 'TABLE') order by 1")
-        rows = [dict(row)['object_name'] for row in result]
+        rows = result.scalars().all()
         return rows
 
     def read_datasource_columns(self, datasource_name):
         """Get list of all column names of the passed datasource_name."""
 
-        result = db.execute(f"select column_name from user_tab_cols where table_name = '{datasource_name}' order by column_id")
-        rows = [dict(row)['column_name'] for row in result]
+        select = sa.text("select column_name from user_tab_cols where table_name = :table_name order by column_id")
+        result = db.execute(select, {'table_name': datasource_name})
+        rows = result.scalars().all()
         return rows
 
     def read_datasource_date_columns(self, datasource_name):
         """Get list of all DATE type column names of the passed datasource_name."""
 
-        result = db.execute(f"select column_name from user_tab_cols where table_name = '{datasource_name}' and (data_type = 'DATE' or data_type like 'TIMESTAMP%') order by column_id")
-        rows = [dict(row)['column_name'] for row in result]
+        select = sa.text("select column_name from user_tab_cols where table_name = :table_name and (data_type = 'DATE' or data_type like 'TIMESTAMP%') order by column_id")
+        result = db.execute(select, {'table_name': datasource_name})
+        rows = result.scalars().all()
         return rows
 
     def save_control(self, data):
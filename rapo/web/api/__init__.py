@@ -3,4 +3,4 @@
 from .app import app
 
 
-__all__ = [app]
+__all__ = ['app']
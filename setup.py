@@ -13,11 +13,11 @@ long_description = open('README.md', 'r').read()
 long_description_content_type = 'text/markdown'
 license = rapo.__license__
 url = f'https://github.com/t3eHawk/{name}'
-python_requires = '>=3.7'
+python_requires = '>=3.8'
 install_requires = open('requirements.txt').read().splitlines()
 packages = setuptools.find_packages()
 package_data = {'rapo': ['web/api/templates/*', 'web/api/ui/**/*']}
-classifiers = ['Programming Language :: Python :: 3.7',
+classifiers = ['Programming Language :: Python :: 3.8',
                'Programming Language :: Python :: 3.11',
                'License :: OSI Approved :: MIT License',
                'Operating System :: OS Independent']